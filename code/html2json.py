@@ -87,11 +87,7 @@ class JsonEntry:
     def phoneticize(self, roots):
         result = []
         for word in roots:
-            temp = tokenize(word)
-            temp = redouble(temp)
-            temp = convert2ipa(temp)
-            temp = tokens2string(temp)
-            result.append(temp)
+            result.append(word_to_ipa(word))
         return result
 
     def rootGen(self, roots):
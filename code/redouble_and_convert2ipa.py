@@ -11,9 +11,93 @@ and the convert2ipa function:
     aangkegtat --> ɑːŋkəxtɑt
 
 '''
+import functools
+import multiprocessing
 import re
 
 
+IPA = {
+   # vowels
+   "i":"\u0069",                # LATIN SMALL LETTER I
+   "a":"\u0251",                # LATIN SMALL LETTER ALPHA
+   "u":"\u0075",                # LATIN SMALL LETTER U
+   "e":"\u0259",                # LATIN SMALL LETTER SCHWA
+
+   "ii":"\u0069\u02D0",         # LATIN SMALL LETTER I to I with IPA COLON
+   "aa":"\u0251\u02D0",         # LATIN SMALL LETTER ALPHA to ALPHA with IPA COLON
+   "uu":"\u0075\u02D0",         # LATIN SMALL LETTER U to U with IPA COLON
+
+   # stops
+   "p" :"\u0070",               # LATIN SMALL LETTER P
+   "t" :"\u0074",               # LATIN SMALL LETTER T
+   "k" :"\u006B",               # LATIN SMALL LETTER K
+   "kw":"\u006B\u02B7",         # LATIN SMALL LETTER K with MODIFIER LETTER SMALL W
+   "q" :"\u0071",               # LATIN SMALL LETTER Q
+   "qw":"\u0071\u02B7",         # LATIN SMALL LETTER Q with MODIFIER LETTER SMALL W
+
+   # voiced fricatives
+   "v"  :"\u0076",              # LATIN SMALL LETTER V
+   "l"  :"\u006C",              # LATIN SMALL LETTER L
+   "z"  :"\u007A",              # LATIN SMALL LETTER Z
+   "y"  :"\u006A",              # LATIN SMALL LETTER J
+   "r"  :"\u0279",              # LATIN SMALL LETTER TURNED R
+   "g"  :"\u0263",              # LATIN SMALL LETTER GAMMA
+   "w"  :"\u0263\u02B7",        # LATIN SMALL LETTER GAMMA with MODIFIER LETTER SMALL W
+   "gh" :"\u0281",              # LATIN LATTER SMALL CAPITAL INVERTED R
+   "ghw":"\u0281\u02B7",        # LATIN LATTER SMALL CAPITAL INVERTED R with MODIFIER LETTER SMALL W
+
+   # voiceless fricatives
+   "f"   :"\u0066",             # LATIN SMALL LETTER F
+   "ll"  :"\u026C",             # LATIN SMALL LETTER L WITH BELT
+   "s"   :"\u0073",             # LATIN SMALL LETTER S
+   "rr"  :"\u0282",             # LATIN SMALL LETTER S WITH HOOK
+   "gg"  :"\u0078",             # LATIN SMALL LETTER X
+   "wh"  :"\u0078\u02B7",       # LATIN SMALL LETTER X with MODIFIER LETTER SMALL W
+   "ghh" :"\u03C7",             # GREEK SMALL LETTER CHI
+   "ghhw":"\u03C7\u02B7",       # GREEK SMALL LETTER CHI with MODIFIER LETTER SMALL W
+   "h"   :"\u0068",             # LATIN SMALL LETTER H
+
+   # voiced nasals
+   "m"  :"\u006D",              # LATIN SMALL LETTER M
+   "n"  :"\u006E",              # LATIN SMALL LETTER N
+   "ng" :"\u014B",              # LATIN SMALL LETTER ENG
+   "ngw":"\u014B\u02B7",        # LATIN SMALL LETTER ENG with MODIFIER LETTER SMALL W
+
+   # voiceless nasals
+   "mm":"\u006D\u0325",          # LATIN SMALL LETTER M   with COMBINING RING BELOW
+   "nn":"\u006E\u0325",          # LATIN SMALL LETTER N   with COMBINING RING BELOW
+   "ngng":"\u014B\u030A",        # LATIN SMALL LETTER ENG with COMBINING RING ABOVE
+   "ngngw":"\u014B\u030A\u02B7", # LATIN SMALL LETTER ENG with COMBINING RING ABOVE and MODIFIER LETTER SMALL W
+}
+
+# the graphemes are exactly the keys of IPA, longest first
+GRAPHEMES = tuple(sorted(IPA, key=lambda grapheme: (-len(grapheme), grapheme)))
+
+
+DOUBLED_FRICATIVE = frozenset(['ll', 'rr', 'gg', 'ghh', 'ghhw'])
+
+DOUBLEABLE_FRICATIVE = frozenset(['l', 'r', 'g', 'gh', 'ghw'])
+DOUBLEABLE_NASAL     = frozenset(['n', 'm', 'ng', 'ngw'])
+
+UNDOUBLEABLE_UNVOICED_CNS = frozenset(['p', 't', 'k', 'kw', 'q', 'qw', 'f', 's', 'wh'])
+
+DOUBLE = {'l'  : 'll',
+          'r'  : 'rr',
+          'g'  : 'gg',
+          'gh' : 'ghh',
+          'ghw': 'ghhw',
+          'n'  : 'nn',
+          'm'  : 'mm',
+          'ng' : 'ngng',
+          'ngw': 'ngngw'}
+
+
+# Matches the graphemes of a reversed word, longest first, falling back to
+# any single character. Graphemes are matched greedily from the end of the
+# word, so the pattern runs over the reversed word.
+TOKEN_RE = re.compile('|'.join(re.escape(grapheme[::-1]) for grapheme in GRAPHEMES) + '|.',
+                      re.DOTALL)
+
 def tokenize(word):
     '''
     :param word: the word to tokenize into graphemes
@@ -22,73 +106,23 @@ def tokenize(word):
     Tokenizes a given Yupik word into its respective graphemes
     '''
 
-    GRAPHEMES = [
-        'ngngw',
-        'ngng',
-        'ghhw',
-        'ghh',
-        'ghw',
-        'ngw',
-        'gg',
-        'gh',
-        'kw',
-        'll',
-        'mm',
-        'ng',
-        'nn',
-        'qw',
-        'rr',
-        'wh',
-        'aa',
-        'ii',
-        'uu',
-        'a',
-        'e',
-        'f',
-        'g',
-        'h',
-        'i',
-        'k',
-        'l',
-        'm',
-        'n',
-        'p',
-        'q',
-        'r',
-        's',
-        't',
-        'u',
-        'v',
-        'w',
-        'y',
-        'z'
-    ]
-
     # lower-case word so we don't have to worry about casing
-    word = word.lower()
-    
-    result = []
-
-    end = len(word) 
-    while end > 0:
-        foundGrapheme = False
-        
-        # attempts to greedy match graphemes starting
-        # from the end of the word
-        for grapheme in GRAPHEMES:
-            if word.endswith(grapheme, 0, end):
-                result.insert(0, grapheme)
-                end -= len(grapheme) 
-                foundGrapheme = True
-                break
-        
-        # if a grapheme was not found, just prepend
-        # the character to the final result
-        if not foundGrapheme: 
-            result.insert(0, word[end-1:end])
-            end -= 1
+    return list(_tokenize_tuple(word.lower()))
 
-    return result
+
+@functools.lru_cache(maxsize=65536)
+def _tokenize_tuple(word):
+    '''
+    :param word: the lower-cased word to tokenize into graphemes
+    :type: str
+
+    Tokenizes a given lower-cased Yupik word into a tuple of graphemes,
+    caching the result since dictionary entries share many stems and affixes
+    '''
+
+    ids, matches = _tokenize_ids(word)
+
+    return tuple([ID_GRAPHEMES[i] or match for i, match in zip(ids, matches)])
 
 
 def tokens2string(tokens):
@@ -98,89 +132,153 @@ def tokens2string(tokens):
 
     Joins the given list of tokens into a string
     '''
-    s = ""
-    for i in range(len(tokens)): 
-        s += tokens[i]
+    return "".join(tokens)
 
-    return s
 
+def redouble_position(first, second):
+    '''
+    :param first: the first grapheme of a pair of adjacent graphemes
+    :type: str
+    :param second: the second grapheme of the pair
+    :type: str
 
-def redouble(graphemes):
+    Returns the position within the pair (0 for first, 1 for second) of the
+    grapheme that the orthographic redoubling rules double, or None if no
+    rule applies to the pair
+    '''
+
+    # Rule 1A: Redouble a fricative that appears BEFORE a stop or one of the voiceless
+    #          fricatives, where doubling is not used to show voicelessness.
+    if (first in DOUBLEABLE_FRICATIVE and
+        second in UNDOUBLEABLE_UNVOICED_CNS):
+        return 0
+
+    # Rule 1B: Redouble a fricative that appears AFTER a stop or one of the voiceless
+    #          fricatives, where doubling is not used to show voicelessness.
+    elif (first in UNDOUBLEABLE_UNVOICED_CNS and
+          second in DOUBLEABLE_FRICATIVE):
+        return 1
+
+    # Rule 2: Redouble a nasal that appears after a stop or one of the voiceless fricatives,
+    #         where doubling is not used to show voicelessness.
+    elif (first in UNDOUBLEABLE_UNVOICED_CNS and
+          second in DOUBLEABLE_NASAL):
+        return 1
+
+    # Rule 3A: Redouble a fricative or nasal that appears after a fricative where doubling is
+    #          used to show voicelessness
+    elif (first in DOUBLED_FRICATIVE and
+          (second in DOUBLEABLE_FRICATIVE or
+          second in DOUBLEABLE_NASAL)):
+        return 1
+
+    # Rule 3B: Redouble a fricative or nasal that appears before grapheme -ll-
+    elif (first in DOUBLEABLE_FRICATIVE and
+          second == "ll"):
+        return 0
+
+    return None
+
+
+# Graphemes are also numbered from 1 so that a tokenized word can be held
+# as a compact array of small integers; 0 stands for any character that is
+# not a grapheme. The tables below are indexed by these ids, which must fit
+# in 6 bits to be packed in pairs.
+ID_GRAPHEMES = ('',) + GRAPHEMES
+
+if len(ID_GRAPHEMES) > 64:
+    raise ValueError("Grapheme ids must fit in 6 bits, but there are %d graphemes" % len(GRAPHEMES))
+
+GRAPHEME_IDS = {grapheme: i for i, grapheme in enumerate(ID_GRAPHEMES) if grapheme}
+
+REVERSED_GRAPHEME_IDS = {grapheme[::-1]: i for grapheme, i in GRAPHEME_IDS.items()}
+
+IPA_BY_ID = tuple(IPA.get(grapheme, '') for grapheme in ID_GRAPHEMES)
+
+DOUBLE_BY_ID = bytes([GRAPHEME_IDS.get(DOUBLE.get(grapheme), 0) for grapheme in ID_GRAPHEMES])
+
+
+def build_pair_actions():
+    '''
+    Builds a flat table, indexed by the ids of a pair of adjacent graphemes
+    packed as (first << 6) | second, giving the redoubling action for the
+    pair: 0 if no rule applies, 1 to double the first grapheme and 2 to
+    double the second
+    '''
+    actions = bytearray(64 * 64)
+
+    for first, first_id in GRAPHEME_IDS.items():
+        for second, second_id in GRAPHEME_IDS.items():
+            position = redouble_position(first, second)
+            if position is not None:
+                actions[first_id << 6 | second_id] = position + 1
+
+    return bytes(actions)
+
+
+PAIR_ACTIONS = build_pair_actions()
+
+
+def redouble_inplace(graphemes):
     '''
     :param graphemes: graphemes that comprise the tokenized word
     :type: list
 
     Redoubles all of the relevant consonants in a tokenized Yupik word,
     effectively undoing the orthographic undoubling rules (see page 5 in
-    Jacobson (2001))
+    Jacobson (2001)). The given list is modified in place.
     '''
 
-    DOUBLED_FRICATIVE = ['ll', 'rr', 'gg', 'ghh', 'ghhw']
+    i = 0
+    while (i+1 < len(graphemes)):
+        action = PAIR_ACTIONS[GRAPHEME_IDS.get(graphemes[i], 0) << 6 | GRAPHEME_IDS.get(graphemes[i+1], 0)]
 
-    DOUBLEABLE_FRICATIVE = ['l', 'r', 'g', 'gh', 'ghw']
-    DOUBLEABLE_NASAL     = ['n', 'm', 'ng', 'ngw']
+        if action:
+            j = i + action - 1
+            graphemes[j] = DOUBLE[graphemes[j]]
+            i += 2
+        else:
+            i += 1
 
-    UNDOUBLEABLE_UNVOICED_CNS = ['p', 't', 'k', 'kw', 'q', 'qw', 'f', 's', 'wh']
 
-    double ={'l'  : 'll',
-             'r'  : 'rr',
-             'g'  : 'gg',
-             'gh' : 'ghh',
-             'ghw': 'ghhw',
-             'n'  : 'nn',
-             'm'  : 'mm',
-             'ng' : 'ngng',
-             'ngw': 'ngngw'}
+def redouble(graphemes):
+    '''
+    :param graphemes: graphemes that comprise the tokenized word
+    :type: list
+
+    Returns a copy of the tokenized Yupik word with all of the relevant
+    consonants redoubled, leaving the given list unchanged; see
+    redouble_inplace
+    '''
 
     # copy the list of tokenized graphemes
-    result = graphemes
+    result = graphemes[:]
 
-    i = 0
-    while (i+1 < len(result)):
-        first  = result[i]
-        second = result[i+1]
-    
-        # Rule 1A: Redouble a fricative that appears BEFORE a stop or one of the voiceless
-        #          fricatives, where doubling is not used to show voicelessness.
-        if (first in DOUBLEABLE_FRICATIVE and
-            second in UNDOUBLEABLE_UNVOICED_CNS):
-            result[i] = double[first]
-            i += 2
+    redouble_inplace(result)
 
-        # Rule 1B: Redouble a fricative that appears AFTER a stop or one of the voiceless
-        #          fricatives, where doubling is not used to show voicelessness.
-        elif (first in UNDOUBLEABLE_UNVOICED_CNS and
-              second in DOUBLEABLE_FRICATIVE):
-            result[i+1] = double[second]
-            i += 2
+    return result
 
-        # Rule 2: Redouble a nasal that appears after a stop or one of the voiceless fricatives,
-        #         where doubling is not used to show voicelessness.
-        elif (first in UNDOUBLEABLE_UNVOICED_CNS and
-              second in DOUBLEABLE_NASAL):
-            result[i+1] = double[second]
-            i += 2
 
-        # Rule 3A: Redouble a fricative or nasal that appears after a fricative where doubling is
-        #          used to show voicelessness
-        elif (first in DOUBLED_FRICATIVE and
-              (second in DOUBLEABLE_FRICATIVE or
-              second in DOUBLEABLE_NASAL)):
-            result[i+1] = double[second]
-            i += 2
+def redouble_ids(ids):
+    '''
+    :param ids: grapheme ids that comprise the tokenized word
+    :type: bytearray
 
-        # Rule 3B: Redouble a fricative or nasal that appears before grapheme -ll-
-        elif (first in DOUBLEABLE_FRICATIVE and
-              second == "ll"):
-            result[i] = double[first]
-            i += 2
+    Redoubles all of the relevant consonants in a tokenized Yupik word held
+    as grapheme ids, in place; the id counterpart of redouble_inplace
+    '''
 
+    i = 0
+    while (i+1 < len(ids)):
+        action = PAIR_ACTIONS[ids[i] << 6 | ids[i+1]]
+
+        if action:
+            j = i + action - 1
+            ids[j] = DOUBLE_BY_ID[ids[j]]
+            i += 2
         else:
             i += 1
 
-    return result
-
-
 
 def convert2ipa(graphemes):
     '''
@@ -188,75 +286,126 @@ def convert2ipa(graphemes):
     :type: list
 
     Converts each grapheme in the tokenized Yupik word to its
-    respective IPA counterpart
-    '''
-
-    ipa = {
-           # vowels                                                                                                                     
-           "i":"\u0069",                # LATIN SMALL LETTER I
-           "a":"\u0251",                # LATIN SMALL LETTER ALPHA
-           "u":"\u0075",                # LATIN SMALL LETTER U
-           "e":"\u0259",                # LATIN SMALL LETTER SCHWA
-
-           "ii":"\u0069\u02D0",         # LATIN SMALL LETTER I to I with IPA COLON
-           "aa":"\u0251\u02D0",         # LATIN SMALL LETTER ALPHA to ALPHA with IPA COLON
-           "uu":"\u0075\u02D0",         # LATIN SMALL LETTER U to U with IPA COLON
- 
-           # stops                                                                                                                      
-           "p" :"\u0070",               # LATIN SMALL LETTER P
-           "t" :"\u0074",               # LATIN SMALL LETTER T
-           "k" :"\u006B",               # LATIN SMALL LETTER K
-           "kw":"\u006B\u02B7",         # LATIN SMALL LETTER K with MODIFIER LETTER SMALL W
-           "q" :"\u0071",               # LATIN SMALL LETTER Q
-           "qw":"\u0071\u02B7",         # LATIN SMALL LETTER Q with MODIFIER LETTER SMALL W
- 
-           # voiced fricatives                                                                                                          
-           "v"  :"\u0076",              # LATIN SMALL LETTER V
-           "l"  :"\u006C",              # LATIN SMALL LETTER L
-           "z"  :"\u007A",              # LATIN SMALL LETTER Z
-           "y"  :"\u006A",              # LATIN SMALL LETTER J
-           "r"  :"\u0279",              # LATIN SMALL LETTER TURNED R
-           "g"  :"\u0263",              # LATIN SMALL LETTER GAMMA
-           "w"  :"\u0263\u02B7",        # LATIN SMALL LETTER GAMMA with MODIFIER LETTER SMALL W
-           "gh" :"\u0281",              # LATIN LATTER SMALL CAPITAL INVERTED R
-           "ghw":"\u0281\u02B7",        # LATIN LATTER SMALL CAPITAL INVERTED R with MODIFIER LETTER SMALL W
-   
-           # voiceless fricatives                                                                                                       
-           "f"   :"\u0066",             # LATIN SMALL LETTER F
-           "ll"  :"\u026C",             # LATIN SMALL LETTER L WITH BELT
-           "s"   :"\u0073",             # LATIN SMALL LETTER S
-           "rr"  :"\u0282",             # LATIN SMALL LETTER S WITH HOOK
-           "gg"  :"\u0078",             # LATIN SMALL LETTER X
-           "wh"  :"\u0078\u02B7",       # LATIN SMALL LETTER X with MODIFIER LETTER SMALL W
-           "ghh" :"\u03C7",             # GREEK SMALL LETTER CHI
-           "ghhw":"\u03C7\u02B7",       # GREEK SMALL LETTER CHI with MODIFIER LETTER SMALL W
-           "h"   :"\u0068",             # LATIN SMALL LETTER H
-   
-           # voiced nasals                                                                                                              
-           "m"  :"\u006D",              # LATIN SMALL LETTER M
-           "n"  :"\u006E",              # LATIN SMALL LETTER N
-           "ng" :"\u014B",              # LATIN SMALL LETTER ENG
-           "ngw":"\u014B\u02B7",        # LATIN SMALL LETTER ENG with MODIFIER LETTER SMALL W
-   
-           # voiceless nasals                                                                                                           
-           "mm":"\u006D\u0325",          # LATIN SMALL LETTER M   with COMBINING RING BELOW
-           "nn":"\u006E\u0325",          # LATIN SMALL LETTER N   with COMBINING RING BELOW
-           "ngng":"\u014B\u030A",        # LATIN SMALL LETTER ENG with COMBINING RING ABOVE
-           "ngngw":"\u014B\u030A\u02B7", # LATIN SMALL LETTER ENG with COMBINING RING ABOVE and MODIFIER LETTER SMALL W
-          }
-
-    result = []
-
-    if graphemes[-1] == '*':
+    respective IPA counterpart, and returns the resulting IPA string
+    '''
+
+    if graphemes and graphemes[-1] == '*':
         graphemes = graphemes[0:-1]  # Remove '*' marking strong gh. It's not needed in the IPA.
 
-    for grapheme in graphemes:
-        if grapheme in ipa:
-            result.append(ipa[grapheme])
-        else:
-            result.append(grapheme)
+    return "".join([IPA.get(grapheme, grapheme) for grapheme in graphemes])
 
-    return result
+
+def _tokenize_ids(word):
+    '''
+    :param word: the lower-cased word to tokenize
+    :type: str
+
+    Tokenizes a given lower-cased Yupik word into a bytearray of grapheme
+    ids, returning the ids along with the list of matched text for each id,
+    from which characters that are not graphemes (id 0) are read back
+    '''
+
+    # matches of TOKEN_RE are reversed graphemes, collected from the end of
+    # the word, so read them back in reverse; each is held as the id of its
+    # grapheme, or 0 for a single character that is not a grapheme
+    matches = list(reversed(TOKEN_RE.findall(word[::-1])))
+
+    ids = bytearray([REVERSED_GRAPHEME_IDS.get(match, 0) for match in matches])
+
+    return ids, matches
+
+
+def _tokenize_redouble_ids(word):
+    '''
+    :param word: the lower-cased word to tokenize and redouble
+    :type: str
+
+    Tokenizes a given lower-cased Yupik word into grapheme ids as
+    _tokenize_ids does, and redoubles the ids in place
+    '''
+
+    ids, matches = _tokenize_ids(word)
+
+    redouble_ids(ids)
+
+    return ids, matches
+
+
+def redouble_str(word):
+    '''
+    :param word: the word to redouble
+    :type: str
+
+    Redoubles a given Yupik word and returns its redoubled spelling,
+    equivalent to tokens2string(redouble(tokenize(word))) but without the
+    intermediate lists of strings
+    '''
+
+    # lower-case word so we don't have to worry about casing
+    return _redouble_str(word.lower())
+
+
+@functools.lru_cache(maxsize=65536)
+def _redouble_str(word):
+    '''
+    :param word: the lower-cased word to redouble
+    :type: str
+
+    Returns the redoubled spelling of a given lower-cased Yupik word,
+    caching the result
+    '''
+
+    ids, matches = _tokenize_redouble_ids(word)
+
+    return "".join([ID_GRAPHEMES[i] or match for i, match in zip(ids, matches)])
+
+
+def word_to_ipa(word):
+    '''
+    :param word: the word to convert to IPA
+    :type: str
+
+    Converts a given Yupik word to IPA, equivalent to passing the word
+    through tokenize, redouble and convert2ipa in turn, but working on a
+    compact array of grapheme ids instead of intermediate lists of strings
+    '''
+
+    # lower-case word so we don't have to worry about casing
+    return _word_to_ipa(word.lower())
+
+
+@functools.lru_cache(maxsize=65536)
+def _word_to_ipa(word):
+    '''
+    :param word: the lower-cased word to convert to IPA
+    :type: str
+
+    Converts a given lower-cased Yupik word to IPA, caching the result
+    '''
+
+    ids, matches = _tokenize_redouble_ids(word)
+
+    if matches and matches[-1] == '*':
+        matches.pop()  # Remove '*' marking strong gh. It's not needed in the IPA.
+
+    # characters that are not graphemes have no IPA and are passed through;
+    # zip stops at the end of matches, so the id of a removed '*' is skipped
+    return "".join([IPA_BY_ID[i] or match for i, match in zip(ids, matches)])
+
+
+def convert_corpus(words, workers=None):
+    '''
+    :param words: the words to convert to IPA
+    :type: iterable
+    :param workers: the number of worker processes, or None for one per CPU
+    :type: int
+
+    Converts each word in a large collection of Yupik words to IPA using a
+    pool of worker processes, returning the results in the order of the words
+    '''
+
+    with multiprocessing.Pool(workers) as pool:
+        return list(pool.imap(word_to_ipa, words, chunksize=1024))
 
 
 def main():
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from redouble_and_convert2ipa import convert_corpus, tokenize, redouble, redouble_inplace, convert2ipa, redouble_str, word_to_ipa
+
+
+class TestTokenize(unittest.TestCase):
+
+    def test_graphemes(self):
+        self.assertEqual(tokenize("aangkegtat"), ["aa", "ng", "k", "e", "g", "t", "a", "t"])
+
+    def test_casing(self):
+        self.assertEqual(tokenize("Aangkegtat"), tokenize("aangkegtat"))
+
+    def test_greedy_from_end_nng(self):
+        self.assertEqual(tokenize("nng"), ["n", "ng"])
+
+    def test_greedy_from_end_lll(self):
+        self.assertEqual(tokenize("lll"), ["l", "ll"])
+
+    def test_non_grapheme(self):
+        self.assertEqual(tokenize("aagyug-"), ["aa", "g", "y", "u", "g", "-"])
+
+
+class TestRedouble(unittest.TestCase):
+
+    def test_redouble(self):
+        self.assertEqual(redouble(["aa", "ng", "k", "e", "g", "t", "a", "t"]),
+                         ["aa", "ng", "k", "e", "gg", "t", "a", "t"])
+
+    def test_input_unchanged(self):
+        graphemes = ["aa", "ng", "k", "e", "g", "t", "a", "t"]
+        redouble(graphemes)
+        self.assertEqual(graphemes, ["aa", "ng", "k", "e", "g", "t", "a", "t"])
+
+    def test_inplace(self):
+        graphemes = ["aa", "ng", "k", "e", "g", "t", "a", "t"]
+        self.assertIsNone(redouble_inplace(graphemes))
+        self.assertEqual(graphemes, ["aa", "ng", "k", "e", "gg", "t", "a", "t"])
+
+    def test_empty(self):
+        self.assertEqual(redouble([]), [])
+
+    def test_strong_gh_only(self):
+        self.assertEqual(redouble(["*"]), ["*"])
+
+
+class TestConvert2ipa(unittest.TestCase):
+
+    def test_convert2ipa(self):
+        self.assertEqual(convert2ipa(["aa", "ng", "k", "e", "gg", "t", "a", "t"]), "ɑːŋkəxtɑt")
+
+    def test_empty(self):
+        self.assertEqual(convert2ipa([]), "")
+
+    def test_non_grapheme(self):
+        self.assertEqual(convert2ipa(["a", "-", "ng"]), "ɑ-ŋ")
+
+    def test_strong_gh(self):
+        self.assertEqual(convert2ipa(["i", "gh", "*"]), "iʁ")
+
+
+class TestWordToIpa(unittest.TestCase):
+
+    def test_docstring_example(self):
+        self.assertEqual(word_to_ipa("aangkegtat"), "ɑːŋkəxtɑt")
+
+    def test_casing(self):
+        self.assertEqual(word_to_ipa("Aangkegtat"), "ɑːŋkəxtɑt")
+
+    def test_non_grapheme(self):
+        self.assertEqual(word_to_ipa("aagyug-"), "ɑːɣjuɣ-")
+
+    def test_strong_gh(self):
+        self.assertEqual(word_to_ipa("qikmigh*"), "qikm̥iʁ")
+
+
+
+class TestRedoubleStr(unittest.TestCase):
+
+    def test_docstring_example(self):
+        self.assertEqual(redouble_str("aangkegtat"), "aangkeggtat")
+
+    def test_casing(self):
+        self.assertEqual(redouble_str("Aangkegtat"), "aangkeggtat")
+
+    def test_non_grapheme(self):
+        self.assertEqual(redouble_str("ketgaq-"), "ketggaq-")
+
+    def test_non_grapheme_blocks_rule(self):
+        self.assertEqual(redouble_str("g-t"), "g-t")
+
+    def test_strong_gh_kept(self):
+        self.assertEqual(redouble_str("qikmigh*"), "qikmmigh*")
+
+
+
+class TestConvertCorpus(unittest.TestCase):
+
+    def test_matches_word_to_ipa_in_order(self):
+        words = ["aangkegtat", "", "qikmigh*", "aagyug-", "Aangkegtat", "lll"]
+        self.assertEqual(convert_corpus(words, workers=2), [word_to_ipa(word) for word in words])
+
+
+if __name__ == '__main__':
+    unittest.main()